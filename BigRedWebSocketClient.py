@@ -7,8 +7,8 @@ BigRed WebSocket Client
 This script scans a specified IPv4 network to discover NetScout nGeniusPULSE devices
 (e.g., nPoints) running a WebSocket server on port 8000. It queries devices for
 attributes such as MAC address, build version, and system information, and logs
-results to a file. The script is designed for embedded systems, using Python 3
-with the 'websockets' library as an external dependency (see requirements.txt).
+results to a file. The script is designed for embedded systems, using only the
+Python 3 standard library (a minimal WebSocket client is built on asyncio streams).
 
 Author: Kris Armstrong
 Version: 3.0.0
@@ -22,15 +22,18 @@ __version__ = "3.0.0"
 # Standard Library Imports
 import argparse
 import asyncio
+import binascii
+import bisect
+import functools
 import hashlib
 import ipaddress
 import logging
+import re
+import socket
+import struct
 from datetime import datetime
 import sys
 
-# External Dependency (see requirements.txt)
-import websockets
-
 # Global Configuration
 class Config:
     """Global configuration constants for the BigRed WebSocket Client."""
@@ -39,18 +42,88 @@ class Config:
     log_file = "bigred_websocket.log"  # Log file for debugging and info
     websocket_port = 8000  # WebSocket port for nGeniusPULSE devices
     max_display_level = 9  # Maximum display info level
+    max_concurrency = 256  # Number of hosts scanned simultaneously
+    signature_cache_size = 4096  # Cached (query, nonce) signatures
+    socket_buffer_size = 8192  # Kernel send/receive buffer per connection
+
+
+# Device queries in display order, as parallel tuples indexed by position.
+# QUERY_MIN_LEVELS is sorted, so the queries shown at a display level are
+# always a prefix of QUERY_KEYS.
+QUERY_KEYS = (
+    "gtme_web",
+    "bver",
+    "temp",
+    "link",
+    "up_dhm",
+    "batt",
+    "poev",
+    "gurl",
+    "mach",
+    "sw_port",
+    "sw_addr",
+    "sw_name",
+    "free",
+)
+QUERY_MIN_LEVELS = (0, 0, 1, 1, 1, 2, 2, 2, 2, 3, 3, 3, 4)
+QUERY_NAMES_EN = (
+    "MAC Address",
+    "Build Version",
+    "CPU Temp (degC)",
+    "Link Info",
+    "System UpTime",
+    "Voltage - Battery",
+    "Voltage - PoE",
+    "Gemini Cloud URL",
+    "Machine Hardware Name",
+    "Nearest Switch - Port",
+    "Nearest Switch - IP/MAC",
+    "Nearest Switch - Name",
+    "Memory Information...",
+)
+QUERY_NAMES_ES = (
+    "Dirección MAC",
+    "Información de la versión",
+    "CPU temperatura (degC)",
+    "Enlace información",
+    "El tiempo de actividad",
+    "Voltaje - Batería",
+    "Voltaje - PoE",
+    "Gemini Cloud URL",
+    "Máquina nombre de hardware",
+    "Conmutador de red - Identificador de puerto",
+    "Conmutador de red - Dirección (IP/MAC)",
+    "Conmutador de red - Nombre",
+    "Información de la memoria...",
+)
+
+# Per-query constants, encoded once at import
+QUERY_BYTES = {key: key.encode("utf-8") for key in QUERY_KEYS}
+SIGNATURE_LEN = 40  # Hex-encoded SHA-1 digest
+
+# Device message fields, extracted from the raw frame in a single pass
+NONCE_RE = re.compile(rb'"nonce":\s*"([^"]*)"')
+RESPONSE_RE = re.compile(
+    rb'"nonce":\s*"([^"]*)".*?"data":\s*"((?:[^"\\]|\\.)*)"', re.DOTALL
+)
+
+# Memory information ("free") reformatting: "MemFree: 512 kB" -> "MemFree= 512 k"
+FREE_TRANSLATION = bytes.maketrans(b":", b"=")
 
 
 def setup_logging(verbose=False):
     """Configure logging to write to a file with a standardized format.
 
+    Per-message debug records are only produced in verbose mode; otherwise
+    the log holds info-level scan progress, errors, and the summary.
+
     Args:
-        verbose (bool): If True, also log to console.
+        verbose (bool): If True, log debug messages and also log to console.
     """
     logging.basicConfig(
         filename=Config.log_file,
         filemode="w",
-        level=logging.DEBUG,
+        level=logging.DEBUG if verbose else logging.INFO,
         format="%(asctime)s [%(levelname)s] %(message)s",
     )
     if verbose:
@@ -116,16 +189,16 @@ def parse_arguments():
     parser.add_argument(
         "--verbose",
         action="store_true",
-        help="Enable verbose console output",
+        help="Enable verbose console output and debug logging",
     )
 
     args = parser.parse_args()
 
-    # Validate network
+    # Validate network (IPv4 only)
     try:
-        ipaddress.ip_network(args.network, strict=False)
+        ipaddress.IPv4Network(args.network, strict=False)
     except ValueError as err:
-        parser.error(f"Invalid network address: {args.network} ({err})")
+        parser.error(f"Invalid IPv4 network address: {args.network} ({err})")
 
     # Validate timeout
     if args.timeout <= 0:
@@ -134,92 +207,314 @@ def parse_arguments():
     return args
 
 
-async def query_device(ip_addr, queries, timeout, display_level, language, mac_filter):
-    """Query a NetScout nGeniusPULSE device via WebSocket for specified attributes.
+# Minimal WebSocket client (RFC 6455) - the devices speak plain ws:// on port
+# 8000, so a fixed upgrade request and unmasked client frames are sufficient.
+WS_UPGRADE_REQUEST = (
+    b"GET / HTTP/1.1\r\n"
+    b"Host: nGeniusPULSE\r\n"
+    b"Upgrade: websocket\r\n"
+    b"Connection: Upgrade\r\n"
+    b"Sec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\n"
+    b"Sec-WebSocket-Version: 13\r\n"
+    b"\r\n"
+)
+WS_OPCODE_CONTINUATION = 0x0
+WS_OPCODE_TEXT = 0x1
+WS_OPCODE_CLOSE = 0x8
+
+
+async def ws_handshake(reader, writer, timeout):
+    """Upgrade an open TCP connection to the WebSocket protocol.
+
+    Args:
+        reader (asyncio.StreamReader): Stream of the TCP connection.
+        writer (asyncio.StreamWriter): Stream of the TCP connection.
+        timeout (float): Timeout for the handshake.
+
+    Raises:
+        ConnectionError: If the server refuses the WebSocket upgrade.
+        asyncio.TimeoutError: If the handshake does not complete in time.
+    """
+    writer.write(WS_UPGRADE_REQUEST)
+    response = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout)
+    if not response.startswith(b"HTTP/1.1 101"):
+        status_line = response.split(b"\r\n", 1)[0]
+        raise ConnectionError(f"WebSocket upgrade rejected: {status_line!r}")
+
+
+def ws_frame(payload):
+    """Build a single WebSocket text frame for a payload.
+
+    The frame is masked with an all-zero key, so the payload is sent as-is.
+
+    Args:
+        payload (bytes): UTF-8 encoded message.
+
+    Returns:
+        bytes: Complete frame, ready to write to the stream.
+    """
+    length = len(payload)
+    if length < 126:
+        header = struct.pack("!BBI", 0x80 | WS_OPCODE_TEXT, 0x80 | length, 0)
+    elif length < 0x10000:
+        header = struct.pack("!BBHI", 0x80 | WS_OPCODE_TEXT, 0x80 | 126, length, 0)
+    else:
+        header = struct.pack("!BBQI", 0x80 | WS_OPCODE_TEXT, 0x80 | 127, length, 0)
+    return header + payload
+
+
+async def ws_recv(reader):
+    """Receive one complete WebSocket message.
+
+    Control frames other than close are skipped; fragmented messages are
+    reassembled.
+
+    Args:
+        reader (asyncio.StreamReader): Stream of an upgraded connection.
+
+    Returns:
+        bytes: Message payload.
+
+    Raises:
+        ConnectionError: If the server sends a close frame.
+        asyncio.IncompleteReadError: If the connection drops mid-frame.
+    """
+    message = b""
+    while True:
+        first, second = await reader.readexactly(2)
+        length = second & 0x7F
+        if length == 126:
+            (length,) = struct.unpack("!H", await reader.readexactly(2))
+        elif length == 127:
+            (length,) = struct.unpack("!Q", await reader.readexactly(8))
+        mask = await reader.readexactly(4) if second & 0x80 else None
+        payload = await reader.readexactly(length)
+        if mask:
+            payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+
+        opcode = first & 0x0F
+        if opcode == WS_OPCODE_CLOSE:
+            raise ConnectionError("WebSocket closed by peer")
+        if opcode in (WS_OPCODE_TEXT, WS_OPCODE_CONTINUATION):
+            message += payload
+            if first & 0x80:
+                return message
+
+
+def build_query_frame(query_key):
+    """Build the WebSocket frame for a query with a blank signature.
+
+    The signature has a fixed length, so every frame for a query is identical
+    apart from the signature bytes at a fixed offset.
+
+    Args:
+        query_key (str): Query call type (e.g., "gtme_web").
+
+    Returns:
+        tuple: (frame template as bytes, offset of the signature in the frame).
+    """
+    payload_tail = b'"}'
+    payload = (
+        b'{"callType":"'
+        + QUERY_BYTES[query_key]
+        + b'","parameter":"","signature":"'
+        + b"0" * SIGNATURE_LEN
+        + payload_tail
+    )
+    frame = ws_frame(payload)
+    return frame, len(frame) - len(payload_tail) - SIGNATURE_LEN
+
+
+# Complete query frames, keyed by query key: (template, signature offset)
+QUERY_FRAMES = {key: build_query_frame(key) for key in QUERY_KEYS}
+
+
+@functools.lru_cache(maxsize=Config.signature_cache_size)
+def sign_query(query_key, nonce):
+    """Compute the request signature SHA-1(query_key + nonce) as hex.
+
+    Signatures cannot be batched per device: every response carries the
+    nonce for the next query, so each one depends on the previous reply.
+    Results are cached, since devices booted together often issue the same
+    nonces.
+
+    Args:
+        query_key (str): Query call type (e.g., "gtme_web").
+        nonce (bytes): Nonce from the device's previous message.
+
+    Returns:
+        bytes: 40-character hexadecimal signature.
+    """
+    return binascii.hexlify(hashlib.sha1(QUERY_BYTES[query_key] + nonce).digest())
+
+
+def build_query_plan(display_level, language):
+    """Select the queries and display names used for a whole scan.
+
+    The display level and language are fixed for a scan, so they are resolved
+    once here rather than per query per device.
 
     Args:
-        ip_addr (str): IP address of the device.
-        queries (dict): Dictionary of query keys and display names.
-        timeout (float): Timeout for WebSocket operations.
         display_level (int): Level of information to display (0-9).
         language (str): Language code ("EN" or "ES").
-        mac_filter (str): MAC address suffix filter (empty if none).
 
     Returns:
-        bool: True if a valid device was found, False otherwise.
+        tuple: (query_key, UTF-8 display name, frame template, signature
+        offset) for each query to send, in display order.
+    """
+    # Queries enabled at this display level form a prefix of QUERY_KEYS
+    num_queries = bisect.bisect_right(QUERY_MIN_LEVELS, display_level)
+    names = QUERY_NAMES_EN if language == "EN" else QUERY_NAMES_ES
+    return tuple(
+        (query_key, name.encode("utf-8")) + QUERY_FRAMES[query_key]
+        for query_key, name in zip(QUERY_KEYS[:num_queries], names)
+    )
+
+
+async def query_device(ip_addr, reader, writer, timeout, query_plan, mac_filter_re):
+    """Query a NetScout nGeniusPULSE device via WebSocket for specified attributes.
+
+    The connection is upgraded to WebSocket here and always closed on return.
+    Output lines are collected rather than printed, so that results from
+    concurrent queries can be written in address order.
+
+    Args:
+        ip_addr (str): IP address of the device.
+        reader (asyncio.StreamReader): Stream of an open TCP connection.
+        writer (asyncio.StreamWriter): Stream of an open TCP connection.
+        timeout (float): Timeout for the handshake and each device response.
+        query_plan (tuple): Queries to send, from build_query_plan.
+        mac_filter_re (re.Pattern): Case-insensitive MAC address filter
+            pattern, or None if no filter is set.
+
+    Returns:
+        tuple: (found, lines) where found is True if a valid device was found
+        and lines is the list of UTF-8 output lines for the device.
     """
-    server_url = f"ws://{ip_addr}:{Config.websocket_port}"
     nonce = None
     mac_filter_found = False
+    lines = []
+    # Checked once per device; skips building debug records on the hot path
+    debug = logging.getLogger().isEnabledFor(logging.DEBUG)
 
     try:
-        async with websockets.connect(server_url, timeout=timeout) as ws:
-            # Receive initial nonce
-            result = await ws.recv()
+        await ws_handshake(reader, writer, timeout)
+
+        # Receive initial nonce
+        result = await asyncio.wait_for(ws_recv(reader), timeout)
+        if debug:
             logging.debug("Received from %s: %s", ip_addr, result)
-            nonce = result.partition('nonce": "')[2].partition('", "uname')[0]
-            if not nonce:
-                logging.debug("No nonce received from %s", ip_addr)
-                return False
-
-            for query_key, (en_name, es_name) in queries.items():
-                # Check display level
-                if (
-                    (query_key == "temp" and display_level < 1)
-                    or (query_key == "batt" and display_level < 2)
-                    or (query_key == "sw_port" and display_level < 3)
-                    or (query_key == "free" and display_level < 4)
-                ):
-                    break
-
-                # Prepare and send query
-                instring = f"{query_key}{nonce}".encode("utf-8")
-                signature = hashlib.sha1(instring).hexdigest()
-                payload = f'{{"callType":"{query_key}","parameter":"","signature":"{signature}"}}'
-                await ws.send(payload)
-                logging.debug("Sent to %s: %s", ip_addr, payload)
-
-                # Receive response
-                result = await ws.recv()
+        match = NONCE_RE.search(result)
+        nonce = match.group(1) if match else b""
+        if not nonce:
+            logging.debug("No nonce received from %s", ip_addr)
+            return False, lines
+
+        for query_key, name, frame_template, sig_offset in query_plan:
+            # Prepare and send query
+            signature = sign_query(query_key, nonce)
+            frame = bytearray(frame_template)
+            frame[sig_offset : sig_offset + SIGNATURE_LEN] = signature
+            writer.write(frame)
+            if debug:
+                logging.debug("Sent %s to %s (signature %s)", query_key, ip_addr, signature)
+
+            # Receive response
+            result = await asyncio.wait_for(ws_recv(reader), timeout)
+            if debug:
                 logging.debug("Received from %s: %s", ip_addr, result)
-                data = (
-                    result.partition('data": "')[2]
-                    .partition('", "success')[0]
-                    .replace("\\n", " ")
-                )
-
-                # Handle MAC filter for first query (gtme_web)
-                if query_key == "gtme_web" and mac_filter:
-                    if mac_filter.lower() in data.lower():
-                        mac_filter_found = True
-                    else:
-                        return False
-
-                # Print IP address on first valid query
-                if query_key == "gtme_web":
-                    name = en_name if language == "EN" else es_name
-                    print(f"{name}= {ip_addr}")
-                    logging.info("Found nGeniusPULSE device at %s", ip_addr)
-
-                # Format and print data
-                name = en_name if language == "EN" else es_name
-                if query_key == "free":
-                    print(f"{name}")
-                    data = data.replace(":", "=").replace("kB ", "kB\n").replace("kB", "k")
-                elif query_key in ("batt", "poev"):
-                    data = data[5:] if len(data) > 5 else data
-                    print(f"{name}= {data}")
+            # Extract data and the nonce for the next query
+            match = RESPONSE_RE.search(result)
+            nonce, data = match.groups() if match else (b"", b"")
+            data = data.replace(b"\\n", b" ")
+
+            # Handle MAC filter for first query (gtme_web)
+            if query_key == "gtme_web" and mac_filter_re:
+                if mac_filter_re.search(data):
+                    mac_filter_found = True
                 else:
-                    print(f"{name}= {data}")
+                    # Reset instead of a graceful close; nothing else is
+                    # needed from a device that does not match
+                    writer.transport.abort()
+                    return False, lines
+
+            # Report IP address on first valid query
+            if query_key == "gtme_web":
+                lines.append(b"%s= %s\n" % (name, ip_addr.encode("ascii")))
+                logging.info("Found nGeniusPULSE device at %s", ip_addr)
+
+            # Format and report data
+            if query_key == "free":
+                data = data.translate(FREE_TRANSLATION)
+                data = data.replace(b"kB ", b"k\n").replace(b"kB", b"k")
+                lines.append(b"%s\n%s\n" % (name, data.rstrip()))
+            elif query_key in ("batt", "poev"):
+                data = data[5:] if len(data) > 5 else data
+                lines.append(b"%s= %s\n" % (name, data))
+            else:
+                lines.append(b"%s= %s\n" % (name, data))
+
+        return (True if not mac_filter_re or mac_filter_found else False), lines
+
+    except (
+        asyncio.IncompleteReadError,
+        asyncio.LimitOverrunError,
+        asyncio.TimeoutError,
+        OSError,
+    ) as err:
+        logging.debug("Failed to query %s: %s", ip_addr, err)
+        return False, lines
+    finally:
+        writer.close()
 
-                # Update nonce for next query
-                nonce = result.partition('nonce": "')[2].partition('", "data')[0]
 
-            return True if not mac_filter or mac_filter_found else False
+def tune_socket(writer):
+    """Tune a device connection for small request/response exchanges.
+
+    Disables Nagle's algorithm so each small frame goes out immediately, and
+    caps the kernel buffers to keep memory bounded across many simultaneous
+    connections. On Linux, TCP_QUICKACK is also requested so the device's
+    first reply (the upgrade response) is acknowledged without delay; the
+    option is not sticky, and the kernel may return to delayed ACKs after it.
+
+    Args:
+        writer (asyncio.StreamWriter): Stream of an open TCP connection.
+    """
+    sock = writer.get_extra_info("socket")
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if hasattr(socket, "TCP_QUICKACK"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, Config.socket_buffer_size)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, Config.socket_buffer_size)
+    except OSError as err:
+        logging.debug("Could not tune socket: %s", err)
 
-    except (websockets.exceptions.ConnectionClosed, asyncio.TimeoutError, OSError) as err:
-        logging.debug("Failed to query %s: %s", ip_addr, err)
-        return False
+
+async def probe_device(ip_addr, timeout):
+    """Check whether the WebSocket port accepts TCP connections on a host.
+
+    The connection is left open so that query_device can reuse it instead of
+    connecting a second time.
+
+    Args:
+        ip_addr (str): IP address of the host.
+        timeout (float): Timeout for the TCP connection attempt.
+
+    Returns:
+        tuple: (reader, writer) if the port is open, None otherwise.
+    """
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(ip_addr, Config.websocket_port), timeout
+        )
+    except (asyncio.TimeoutError, OSError) as err:
+        logging.debug("No listener on %s: %s", ip_addr, err)
+        return None
+    tune_socket(writer)
+    return reader, writer
 
 
 async def scan_network(network, timeout, display_level, language, mac_filter):
@@ -235,42 +530,84 @@ async def scan_network(network, timeout, display_level, language, mac_filter):
     Returns:
         int: Number of units found.
     """
-    queries = {
-        "gtme_web": ("MAC Address", "Dirección MAC"),
-        "bver": ("Build Version", "Información de la versión"),
-        "temp": ("CPU Temp (degC)", "CPU temperatura (degC)"),
-        "link": ("Link Info", "Enlace información"),
-        "up_dhm": ("System UpTime", "El tiempo de actividad"),
-        "batt": ("Voltage - Battery", "Voltaje - Batería"),
-        "poev": ("Voltage - PoE", "Voltaje - PoE"),
-        "gurl": ("Gemini Cloud URL", "Gemini Cloud URL"),
-        "mach": ("Machine Hardware Name", "Máquina nombre de hardware"),
-        "sw_port": ("Nearest Switch - Port", "Conmutador de red - Identificador de puerto"),
-        "sw_addr": ("Nearest Switch - IP/MAC", "Conmutador de red - Dirección (IP/MAC)"),
-        "sw_name": ("Nearest Switch - Name", "Conmutador de red - Nombre"),
-        "free": ("Memory Information...", "Información de la memoria..."),
-    }
-
     num_units_found = 0
-    network = ipaddress.ip_network(network, strict=False)
-    ip_list = list(network)[1:-1]  # Exclude network and broadcast addresses
+    network = ipaddress.IPv4Network(network, strict=False)
+    num_hosts = network.num_addresses - 2  # Exclude network and broadcast addresses
+
+    # Format host addresses straight from the integer range, without
+    # materializing an IPv4Address object per host
+    base_addr = int(network.network_address)
+    ip_list = (
+        socket.inet_ntoa((base_addr + offset).to_bytes(4, "big"))
+        for offset in range(1, num_hosts + 1)
+    )
 
     start_time = datetime.now()
-    logging.info("Scanning network: %s (%d IPs)", network, len(ip_list))
+    logging.info("Scanning network: %s (%d IPs)", network, num_hosts)
     print(f"Scan IP Network: {network}")
-    print(f"Scan Begin Addr: {ip_list[0]}")
-    print(f"Scan End Addr:   {ip_list[-1]}")
+    print(f"Scan Begin Addr: {network[1]}")
+    print(f"Scan End Addr:   {network[-2]}")
     print("")
 
-    tasks = [
-        query_device(str(ip), queries, timeout, display_level, language, mac_filter)
-        for ip in ip_list
-    ]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    for result in results:
-        if result and not isinstance(result, Exception):
-            num_units_found += 1
+    query_plan = build_query_plan(display_level, language)
+    mac_filter_re = (
+        re.compile(re.escape(mac_filter.encode("utf-8")), re.IGNORECASE)
+        if mac_filter
+        else None
+    )
+    pending = {}  # Host index -> output lines, for hosts finished out of order
+    next_index = 0  # Index of the next host whose output is due
+
+    def report(index, lines):
+        # Write output in address order as soon as all earlier hosts are done,
+        # instead of interleaving prints from every worker
+        nonlocal next_index
+        pending[index] = lines
+        while next_index in pending:
+            sys.stdout.buffer.writelines(pending.pop(next_index))
+            next_index += 1
+        sys.stdout.buffer.flush()
+
+    # A fixed pool of workers drains a bounded queue, so the number of live
+    # coroutines and sockets depends on Config.max_concurrency, not network size
+    queue = asyncio.Queue(maxsize=Config.max_concurrency)
+
+    async def worker():
+        nonlocal num_units_found
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            index, ip_addr = item
+            lines = ()
+            try:
+                # Probe port 8000 first so dead hosts never reach the handshake
+                streams = await probe_device(ip_addr, timeout)
+                if streams:
+                    found, lines = await query_device(
+                        ip_addr, *streams, timeout, query_plan, mac_filter_re
+                    )
+                    if found:
+                        num_units_found += 1
+            except Exception as err:
+                logging.error("Unexpected error scanning %s: %s", ip_addr, err)
+            report(index, lines)
+
+    async def producer():
+        for item in enumerate(ip_list):
+            await queue.put(item)
+        for _ in workers:
+            await queue.put(None)
+
+    sys.stdout.flush()
+    workers = [asyncio.create_task(worker()) for _ in range(Config.max_concurrency)]
+    try:
+        await asyncio.gather(producer(), *workers)
+    finally:
+        # Still report devices found when the scan is interrupted
+        for index in sorted(pending):
+            sys.stdout.buffer.writelines(pending[index])
+        sys.stdout.buffer.flush()
 
     end_time = datetime.now()
     scan_time = end_time - start_time
@@ -312,4 +649,13 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Optional: uvloop's libuv event loop handles connection-heavy scans faster
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+
+    if uvloop is not None and hasattr(uvloop, "run"):
+        uvloop.run(main())
+    else:
+        asyncio.run(main())